@@ -1,16 +1,26 @@
 import os
-import json
 import sys
+import time
 import asyncio
+import logging
 from datetime import datetime, timezone
-from typing import Dict, Optional, Set
-from fastapi import FastAPI, Request, HTTPException, Query
-from pydantic import BaseModel
+from collections import deque
+from typing import Deque, Dict, Optional, Set, Union
+from fastapi import FastAPI, Request, HTTPException, Query, Response
+from pydantic import BaseModel, Field, ValidationError, field_validator
 import httpx
+import orjson
 import redis.asyncio as redis
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-app = FastAPI()
+# ─── RESPONSES ─────────────────────────────────────────────────────
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (FastAPI's own ORJSONResponse is deprecated)."""
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+app = FastAPI(default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Or specify: ["http://localhost:3000"]
@@ -31,38 +41,111 @@ async def get_redis():
         redis_client = redis.from_url(redis_url, decode_responses=True)
     return redis_client
 
-def dbg(*args):
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-    print(f"[{timestamp}]", *args, file=sys.stderr, flush=True)
+# ─── LOGGING ───────────────────────────────────────────────────────
+# Messages use %-style args so formatting only happens when the level is enabled.
+log = logging.getLogger("lrp")
+log.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+if not log.handlers:  # module may be imported twice (__main__ + uvicorn's "main")
+    _log_handler = logging.StreamHandler(sys.stderr)
+    _log_formatter = logging.Formatter("[%(asctime)s.%(msecs)03d] %(message)s", "%Y-%m-%d %H:%M:%S")
+    _log_formatter.converter = time.gmtime
+    _log_handler.setFormatter(_log_formatter)
+    log.addHandler(_log_handler)
+    log.propagate = False
+
+dbg = log.debug
 
 # ─── CONFIG ────────────────────────────────────────────────────────
 TP_ALT_URL = os.getenv("TP_ALT_URL")
+MAX_BODY_BYTES = 65536  # Pine webhooks are tiny; reject anything larger
+VALID_ACTIONS = frozenset(("buy", "sell", "exit"))
+
+# Constant parts of the TradersPost payloads, merged with per-order fields.
+# The nested extras dicts are shared and must not be mutated.
+_TP_ENTRY_PROTO = {
+    "strategy_id": "Tiger-Alt",
+    "orderType": "market",
+    "timeInForce": "gtc",
+    "extras": {"strategy": "Tiger-Alt-AutoTrail-POST", "version": "2.0"},
+}
+_TP_EXIT_PROTO = {
+    "strategy_id": "Tiger-Alt",
+    "action": "exit",
+    "orderType": "market",
+    "timeInForce": "gtc",
+    "extras": {"exitReason": "pine_signal", "strategy": "Tiger-Alt-AutoTrail-POST", "version": "2.0"},
+}
+_TP_STOP_PROTO = {
+    "strategy_id": "Tiger-Alt",
+    "orderType": "stop",
+    "timeInForce": "gtc",
+}
+
+# ─── HTTP CLIENT ───────────────────────────────────────────────────
+# One pooled client for the whole process so TradersPost posts reuse
+# keep-alive connections instead of paying TCP+TLS setup every call.
+try:
+    import h2  # noqa: F401
+    HTTP2_ENABLED = True
+except ImportError:
+    HTTP2_ENABLED = False
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+HTTP = httpx.AsyncClient(
+    http2=HTTP2_ENABLED,
+    timeout=httpx.Timeout(30.0, connect=3.0),
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30),
+)
 
 # ─── PYDANTIC MODELS ───────────────────────────────────────────────
-# (No models needed for GET-only price updates)
+class AutoTrail(BaseModel):
+    armAfterProfit: Optional[float] = None
+    trailStep: Optional[float] = None
+    hardStop: Optional[float] = None
+
+class EntryExtras(BaseModel):
+    pointValue: Optional[float] = None
+
+class PineEntry(BaseModel):
+    """Pine Script webhook body; validated in one pass from the raw JSON bytes."""
+    strategy_id: Optional[str] = None
+    action: str = ""
+    ticker: Optional[str] = None
+    quantity: Optional[Union[int, float]] = None  # int stays int; fractional sizes allowed
+    price: Optional[float] = None
+    sentiment: Optional[str] = None
+    signalPrice: Optional[float] = None
+    autoTrail: AutoTrail = Field(default_factory=AutoTrail)
+    extras: EntryExtras = Field(default_factory=EntryExtras)
+
+    @field_validator("action")
+    @classmethod
+    def lower_action(cls, v: str) -> str:
+        return v.lower()
 
 # ─── PRICE MONITOR ────────────────────────────────────────────────
 class PriceMonitor:
     def __init__(self):
         self.monitored_symbols: Set[str] = set()
         self.position_manager = None
-        self.price_history = {}
+        self.price_history: Dict[str, Deque[Dict]] = {}
         
     async def add_symbol(self, symbol: str):
         self.monitored_symbols.add(symbol)
-        dbg(f"📡 Added symbol to monitoring: {symbol}")
+        dbg("📡 Added symbol to monitoring: %s", symbol)
     
     async def remove_symbol(self, symbol: str):
         self.monitored_symbols.discard(symbol)
-        if symbol in self.price_history:
-            del self.price_history[symbol]
-        dbg(f"📡 Removed symbol from monitoring: {symbol}")
+        self.price_history.pop(symbol, None)
+        dbg("📡 Removed symbol from monitoring: %s", symbol)
     
     async def process_price_update(self, symbol: str, price: float, source: str = None):
         try:
-            # Store price in history (keep last 10 prices)
-            if symbol not in self.price_history:
-                self.price_history[symbol] = []
+            # Store price in history (deque drops all but the last 10 prices)
+            history = self.price_history.get(symbol)
+            if history is None:
+                history = self.price_history[symbol] = deque(maxlen=10)
             
             price_data = {
                 "price": price,
@@ -70,24 +153,22 @@ class PriceMonitor:
                 "source": source or "external"
             }
             
-            self.price_history[symbol].append(price_data)
-            
-            # Keep only last 10 prices
-            if len(self.price_history[symbol]) > 10:
-                self.price_history[symbol] = self.price_history[symbol][-10:]
+            history.append(price_data)
             
             # Rich logging for price updates
-            status_emoji = "🟢" if symbol in self.monitored_symbols else "🔵"
-            source_info = f" [{source}]" if source else ""
-            dbg(f"{status_emoji} PRICE UPDATE: {symbol} = ${price:,.2f}{source_info} | Monitored: {symbol in self.monitored_symbols}")
+            if log.isEnabledFor(logging.DEBUG):
+                monitored = symbol in self.monitored_symbols
+                dbg("%s PRICE UPDATE: %s = $%s%s | Monitored: %s",
+                    "🟢" if monitored else "🔵", symbol, f"{price:,.2f}",
+                    f" [{source}]" if source else "", monitored)
             
             # Check for auto-trail updates if symbol is monitored
             if symbol in self.monitored_symbols and self.position_manager:
                 trail_result = await self.position_manager.calculate_auto_trail(symbol, price)
                 
                 if trail_result:
-                    dbg(f"🔄 AUTO-TRAIL TRIGGERED: {symbol} -> {trail_result['action'].upper()}")
-                    dbg(f"   └─ New Stop: ${trail_result['new_stop']:.2f} | Locked Profit: ${trail_result['locked_profit']:.2f}")
+                    dbg("🔄 AUTO-TRAIL TRIGGERED: %s -> %s", symbol, trail_result["action"].upper())
+                    dbg("   └─ New Stop: $%.2f | Locked Profit: $%.2f", trail_result["new_stop"], trail_result["locked_profit"])
                     
                     return {
                         "price_processed": True,
@@ -101,7 +182,7 @@ class PriceMonitor:
             }
             
         except Exception as e:
-            dbg(f"❌ Error processing price update: {e}")
+            log.error("❌ Error processing price update: %s", e)
             raise
 
 # ─── POSITION MANAGEMENT ────────────────────────────────────────────
@@ -114,33 +195,56 @@ class PositionManager:
             self.redis = await get_redis()
     
     async def get_position(self, ticker: str) -> Optional[Dict]:
-        await self.init_redis()
         try:
+            await self.init_redis()
             position_data = await self.redis.get(f"position:{ticker}")
             if position_data:
-                return json.loads(position_data)
+                return orjson.loads(position_data)
             return None
         except Exception as e:
-            dbg(f"❌ Redis get error: {e}")
+            log.error("❌ Redis get error: %s", e)
             return None
     
-    async def save_position(self, ticker: str, position_data: Dict):
-        await self.init_redis()
+    async def save_position(self, ticker: str, position_data: Dict, only_existing: bool = False) -> bool:
         try:
-            await self.redis.set(f"position:{ticker}", json.dumps(position_data), ex=86400)
-            dbg(f"💾 Position saved for {ticker}: {position_data}")
+            await self.init_redis()
+            # only_existing (SET XX) keeps an update from reviving a closed position
+            saved = await self.redis.set(
+                f"position:{ticker}", orjson.dumps(position_data), ex=86400, xx=only_existing
+            )
+            if not saved:
+                dbg("⏭️ Position for %s no longer exists; not saved", ticker)
+                return False
+            dbg("💾 Position saved for %s: %s", ticker, position_data)
             await price_monitor.add_symbol(ticker)
+            return True
         except Exception as e:
-            dbg(f"❌ Redis save error: {e}")
+            log.error("❌ Redis save error: %s", e)
+            return False
     
     async def delete_position(self, ticker: str):
-        await self.init_redis()
         try:
+            await self.init_redis()
             await self.redis.delete(f"position:{ticker}")
-            dbg(f"🗑️ Position deleted for {ticker}")
+            dbg("🗑️ Position deleted for %s", ticker)
             await price_monitor.remove_symbol(ticker)
         except Exception as e:
-            dbg(f"❌ Redis delete error: {e}")
+            log.error("❌ Redis delete error: %s", e)
+    
+    async def pop_position(self, ticker: str) -> Optional[Dict]:
+        key = f"position:{ticker}"
+        try:
+            await self.init_redis()
+            # GET + DEL in one MULTI/EXEC (works on any Redis version, unlike GETDEL)
+            async with self.redis.pipeline(transaction=True) as pipe:
+                position_data, _ = await pipe.get(key).delete(key).execute()
+            if position_data:
+                dbg("🗑️ Position deleted for %s", ticker)
+            await price_monitor.remove_symbol(ticker)
+            return orjson.loads(position_data) if position_data else None
+        except Exception as e:
+            log.error("❌ Redis pop error: %s", e)
+            return None
     
     async def calculate_auto_trail(self, ticker: str, current_price: float) -> Optional[Dict]:
         position = await self.get_position(ticker)
@@ -161,7 +265,7 @@ class PositionManager:
         else:
             profit_dollars = (entry_price - current_price) * point_value * quantity
 
-        dbg(f"📈 Auto-trail check: {ticker} | Side: {side} | Entry: ${entry_price} | Current: ${current_price} | Profit: ${profit_dollars:.2f}")
+        dbg("📈 Auto-trail check: %s | Side: %s | Entry: $%s | Current: $%s | Profit: $%.2f", ticker, side, entry_price, current_price, profit_dollars)
 
         if profit_dollars >= arm_after_profit:
             # How far past the arm threshold?
@@ -183,16 +287,15 @@ class PositionManager:
             if current_stop is None or locked_profit > current_locked_profit:
                 position["currentStop"] = new_stop
                 position["lockedProfit"] = locked_profit
-                await self.save_position(ticker, position)
+                if not await self.save_position(ticker, position, only_existing=True):
+                    return None  # position was closed while we were computing
 
                 stop_update_payload = {
-                    "strategy_id": "Tiger-Alt",
+                    **_TP_STOP_PROTO,
                     "ticker": ticker,
                     "action": "sell" if side == "buy" else "buy",
                     "quantity": quantity,
-                    "orderType": "stop",
                     "stopPrice": new_stop,
-                    "timeInForce": "gtc"
                 }
 
                 await send_traderspost(stop_update_payload)
@@ -214,30 +317,36 @@ price_monitor.position_manager = position_manager
 
 # ─── SEND TO TRADERSPOST ───────────────────────────────────────────
 async def send_traderspost(data: Dict):
-    dbg(f"📤 Sending to TradersPost: {TP_ALT_URL}")
-    dbg(f"📤 Payload: {json.dumps(data, indent=2)}")
-    
     if not TP_ALT_URL:
-        dbg("❌ TradersPost URL not configured")
+        log.error("❌ TradersPost URL not configured")
         return {"error": "TradersPost URL not configured"}
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(TP_ALT_URL, json=data)
-            response.raise_for_status()
-            response_data = response.json() if response.content else {}
-            
-            dbg(f"✅ TradersPost response ({response.status_code}): {response_data}")
-            return {"success": True, "response": response_data, "status_code": response.status_code}
-            
+        # Encode once; the same bytes are logged and posted
+        buf = orjson.dumps(data)
+        if log.isEnabledFor(logging.DEBUG):
+            dbg("📤 Sending to TradersPost: %s", TP_ALT_URL)
+            dbg("📤 Payload: %s", buf.decode())
+        
+        response = await HTTP.post(TP_ALT_URL, content=buf, headers=JSON_HEADERS)
+        response.raise_for_status()
+        response_data = orjson.loads(response.content) if response.content else {}
+        
+        dbg("✅ TradersPost response (%s): %s", response.status_code, response_data)
+        return {"success": True, "response": response_data, "status_code": response.status_code}
+        
     except Exception as e:
-        dbg(f"❌ TradersPost error: {str(e)}")
+        log.error("❌ TradersPost error: %s", e)
         return {"error": str(e)}
 
 # ─── BASIC ROUTES ──────────────────────────────────────────────────
+# Encoded once at import. A fresh Response is still built per request because
+# middleware (CORS) mutates response headers in place.
+_ROOT_BODY = orjson.dumps({"message": "Tiger-Alt Bot API v2.0 - POST Price Updates"})
+
 @app.get("/")
 async def root():
-    return {"message": "Tiger-Alt Bot API v2.0 - POST Price Updates"}
+    return Response(_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
@@ -293,7 +402,7 @@ async def price_update(
     except HTTPException:
         raise
     except Exception as e:
-        dbg(f"❌ Price update error: {e}")
+        log.error("❌ Price update error: %s", e)
         raise HTTPException(status_code=500, detail=f"Error processing price update: {str(e)}")
 
 # ─── PRICE HISTORY ENDPOINT ────────────────────────────────────────
@@ -301,7 +410,8 @@ async def price_update(
 async def get_price_history(symbol: str):
     symbol = symbol.strip().upper()
     
-    if symbol not in price_monitor.price_history:
+    history = price_monitor.price_history.get(symbol)
+    if history is None:
         return {
             "symbol": symbol,
             "history": [],
@@ -310,88 +420,83 @@ async def get_price_history(symbol: str):
     
     return {
         "symbol": symbol,
-        "history": price_monitor.price_history[symbol],
-        "count": len(price_monitor.price_history[symbol])
+        "history": list(history),
+        "count": len(history)
     }
 
 # ─── MAIN WEBHOOK ENDPOINT ─────────────────────────────────────────
 @app.post("/pine-entry")
 async def pine_entry(req: Request):
-    raw_body = await req.body()
-    dbg(f"🔄 Raw webhook body: {raw_body}")
+    buf = bytearray()
+    async for chunk in req.stream():
+        buf.extend(chunk)
+        if len(buf) > MAX_BODY_BYTES:
+            log.warning("❌ Webhook body exceeds %s bytes", MAX_BODY_BYTES)
+            raise HTTPException(status_code=413, detail="Body too large")
+    raw_body = bytes(buf)
+    dbg("🔄 Raw webhook body: %s", raw_body)
     
     try:
-        # Parse JSON from body
-        if raw_body.startswith(b'"') and raw_body.endswith(b'"'):
-            text = raw_body.decode("utf-8", errors="ignore").strip('"')
-            data = json.loads(text)
-        else:
-            data = json.loads(raw_body)
+        # Unwrap double-encoded bodies (a JSON string holding the JSON object)
+        if raw_body[:1] == b'"':
+            try:
+                raw_body = orjson.loads(raw_body)
+            except orjson.JSONDecodeError:
+                raw_body = raw_body.strip(b'"')  # quoted but not escaped
+        entry = PineEntry.model_validate_json(raw_body)
         
-        dbg(f"🔍 Parsed webhook data: {json.dumps(data, indent=2)}")
+        dbg("🔍 Parsed webhook data: %r", entry)
         
-    except json.JSONDecodeError as e:
-        dbg(f"❌ JSON decode error: {e}")
-        raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(e)}")
+    except ValidationError as e:
+        log.warning("❌ Invalid webhook body: %s", e)
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False, include_input=False))
     
     # Extract basic fields
-    strategy_id = data.get("strategy_id")
-    action = data.get("action", "").lower()
-    ticker = data.get("ticker")
+    strategy_id = entry.strategy_id
+    action = entry.action
+    ticker = entry.ticker
     
     # Validate required fields
     if not strategy_id or not action or not ticker:
-        dbg(f"❌ Missing required fields: strategy_id={strategy_id}, action={action}, ticker={ticker}")
+        log.warning("❌ Missing required fields: strategy_id=%s, action=%s, ticker=%s", strategy_id, action, ticker)
         raise HTTPException(status_code=400, detail="Missing required fields: strategy_id, action, ticker")
     
-    dbg(f"🎯 Processing webhook: {strategy_id} | {action} | {ticker}")
+    dbg("🎯 Processing webhook: %s | %s | %s", strategy_id, action, ticker)
     
-    # Handle Tiger-Alt strategy only
-    if strategy_id == "Tiger-Alt":
-        return await handle_tiger_alt(data)
-    else:
-        dbg(f"❌ Unsupported strategy: {strategy_id}")
+    # Dispatch to the (strategy_id, action) handler registered in HANDLERS
+    if strategy_id not in SUPPORTED_STRATEGIES:
+        log.warning("❌ Unsupported strategy: %s", strategy_id)
         raise HTTPException(status_code=400, detail=f"Unsupported strategy_id: {strategy_id}. Only Tiger-Alt is supported.")
-
-async def handle_tiger_alt(data: Dict) -> Dict:
-    action = data.get("action", "").lower()
-    ticker = data.get("ticker")
     
-    dbg(f"🐅 Tiger-Alt handler: {action} | {ticker}")
-    
-    if action in ["buy", "sell"]:
-        return await handle_tiger_alt_entry(data)
-    elif action == "exit":
-        return await handle_tiger_alt_exit(data)
-    else:
-        dbg(f"❌ Unknown action for Tiger-Alt: {action}")
+    if action not in VALID_ACTIONS:
+        log.warning("❌ Unknown action for %s: %s", strategy_id, action)
         raise HTTPException(status_code=400, detail=f"Unknown action: {action}")
+    
+    return await HANDLERS[(strategy_id, action)](entry)
 
-async def handle_tiger_alt_entry(data: Dict) -> Dict:
-    ticker = data.get("ticker")
-    action = data.get("action")
-    quantity = data.get("quantity")
-    price = data.get("price")
+async def handle_tiger_alt_entry(entry: PineEntry) -> Dict:
+    ticker = entry.ticker
+    action = entry.action
+    quantity = entry.quantity
+    price = entry.price
     
-    dbg(f"🚀 Tiger-Alt ENTRY: {ticker} | {action} | qty:{quantity} | price:{price}")
+    dbg("🚀 Tiger-Alt ENTRY: %s | %s | qty:%s | price:%s", ticker, action, quantity, price)
     
     # Extract auto-trail parameters
-    auto_trail = data.get("autoTrail", {})
-    arm_after_profit = auto_trail.get("armAfterProfit")
-    trail_step = auto_trail.get("trailStep")
-    hard_stop = auto_trail.get("hardStop")  # Used for reference, not order submission
+    arm_after_profit = entry.autoTrail.armAfterProfit
+    trail_step = entry.autoTrail.trailStep
+    hard_stop = entry.autoTrail.hardStop  # Used for reference, not order submission
 
     # Extract point value
-    extras = data.get("extras", {})
-    point_value = extras.get("pointValue")
+    point_value = entry.extras.pointValue
     
     # Validate required fields
-    if not all([quantity, price, arm_after_profit, trail_step, hard_stop]):
-        missing = [k for k, v in {
-            "quantity": quantity, "price": price, "arm_after_profit": arm_after_profit,
-            "trail_step": trail_step, "hard_stop": hard_stop
-        }.items() if v is None]
-        dbg(f"❌ Missing required fields: {missing}")
+    missing = [k for k, v in (
+        ("quantity", quantity), ("price", price), ("arm_after_profit", arm_after_profit),
+        ("trail_step", trail_step), ("hard_stop", hard_stop),
+    ) if not v]
+    if missing:
+        log.warning("❌ Missing required fields: %s", missing)
         raise HTTPException(status_code=400, detail=f"Missing required fields: {missing}")
     
     # Save position to Redis for auto-trail tracking
@@ -409,28 +514,22 @@ async def handle_tiger_alt_entry(data: Dict) -> Dict:
         "lockedProfit": 0
     }
     
-    await position_manager.save_position(ticker, position_data)
-
     # Build TradersPost market entry payload (NO autoTrail, NO initial stop)
     tp_payload = {
-        "strategy_id": "Tiger-Alt",
+        **_TP_ENTRY_PROTO,
         "ticker": ticker,
         "action": action,
         "quantity": quantity,
-        "orderType": "market",
-        "timeInForce": "gtc",
-        "sentiment": data.get("sentiment", "bullish" if action == "buy" else "bearish"),
+        "sentiment": entry.sentiment or ("bullish" if action == "buy" else "bearish"),
         "price": price,
-        "signalPrice": data.get("signalPrice", price),
-        "extras": {
-            "strategy": "Tiger-Alt-AutoTrail-POST",
-            "version": "2.0"
-        }
+        "signalPrice": entry.signalPrice if entry.signalPrice is not None else price,
     }
     
-    data.pop("autoTrail", None)
-
-    result = await send_traderspost(tp_payload)
+    # Redis save and TradersPost post are independent; run them concurrently
+    _, result = await asyncio.gather(
+        position_manager.save_position(ticker, position_data),
+        send_traderspost(tp_payload),
+    )
 
     return {
         "status": "tiger_alt_entry_processed",
@@ -441,36 +540,25 @@ async def handle_tiger_alt_entry(data: Dict) -> Dict:
         "traderspost_result": result
     }
 
-async def handle_tiger_alt_exit(data: Dict) -> Dict:
-    ticker = data.get("ticker")
-    price = data.get("price")
-    
-    dbg(f"🚪 Tiger-Alt EXIT: {ticker} | price:{price}")
-    
-    # Get position info before deleting
-    position = await position_manager.get_position(ticker)
+async def handle_tiger_alt_exit(entry: PineEntry) -> Dict:
+    ticker = entry.ticker
+    price = entry.price
     
-    # Clean up position tracking
-    await position_manager.delete_position(ticker)
+    dbg("🚪 Tiger-Alt EXIT: %s | price:%s", ticker, price)
     
     # Build exit payload
     tp_payload = {
-        "strategy_id": "Tiger-Alt",
+        **_TP_EXIT_PROTO,
         "ticker": ticker,
-        "action": "exit",
-        "orderType": "market",
-        "timeInForce": "gtc",
         "price": price,
-        "signalPrice": data.get("signalPrice", price),
-        "extras": {
-            "exitReason": "pine_signal",
-            "strategy": "Tiger-Alt-AutoTrail-POST",
-            "version": "2.0"
-        }
+        "signalPrice": entry.signalPrice if entry.signalPrice is not None else price,
     }
     
-    # Send to TradersPost
-    result = await send_traderspost(tp_payload)
+    # Clean up position tracking while sending to TradersPost
+    position, result = await asyncio.gather(
+        position_manager.pop_position(ticker),
+        send_traderspost(tp_payload),
+    )
     
     return {
         "status": "tiger_alt_exit_processed",
@@ -479,6 +567,14 @@ async def handle_tiger_alt_exit(data: Dict) -> Dict:
         "traderspost_result": result
     }
 
+# ─── WEBHOOK DISPATCH ──────────────────────────────────────────────
+HANDLERS = {
+    ("Tiger-Alt", "buy"): handle_tiger_alt_entry,
+    ("Tiger-Alt", "sell"): handle_tiger_alt_entry,
+    ("Tiger-Alt", "exit"): handle_tiger_alt_exit,
+}
+SUPPORTED_STRATEGIES = frozenset(sid for sid, _ in HANDLERS)
+
 # ─── MONITORING ENDPOINTS ──────────────────────────────────────────
 @app.get("/monitor/status")
 async def monitor_status():
@@ -500,7 +596,7 @@ async def get_monitored_symbols():
 async def startup_event():
     try:
         await get_redis()
-        dbg("✅ Redis connection established")
+        log.info("✅ Redis connection established")
         
         # Load existing positions and start monitoring them
         r = await get_redis()
@@ -510,11 +606,11 @@ async def startup_event():
             ticker = key.replace("position:", "")
             await price_monitor.add_symbol(ticker)
         
-        dbg("🚀 Tiger-Alt Bot API v2.0 started successfully")
-        dbg(f"📊 Monitoring symbols: {list(price_monitor.monitored_symbols)}")
+        log.info("🚀 Tiger-Alt Bot API v2.0 started successfully")
+        log.info("📊 Monitoring symbols: %s", list(price_monitor.monitored_symbols))
         
     except Exception as e:
-        dbg(f"❌ Startup error: {e}")
+        log.error("❌ Startup error: %s", e)
         raise
 
 @app.on_event("shutdown")
@@ -522,10 +618,24 @@ async def shutdown_event():
     try:
         if redis_client:
             await redis_client.close()
-        dbg("✅ Clean shutdown completed")
+        await HTTP.aclose()
+        log.info("✅ Clean shutdown completed")
     except Exception as e:
-        dbg(f"❌ Shutdown error: {e}")
+        log.error("❌ Shutdown error: %s", e)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", 8000)))
\ No newline at end of file
+    # Price history and monitored symbols live in-process, so keep one
+    # worker by default. WEB_CONCURRENCY is not used because Heroku sets it.
+    workers = int(os.getenv("UVICORN_WORKERS", 1))
+    uvicorn.run(
+        # Multiple workers need an import string; otherwise pass the app so
+        # this module is not imported a second time as "main"
+        "main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", 8000)),
+        loop="auto",  # picks uvloop when installed
+        http="httptools",
+        workers=workers,
+        timeout_keep_alive=30,
+    )
\ No newline at end of file